@@ -1,16 +1,40 @@
+import codecs
+import concurrent.futures
+import functools
 import json
 import logging
+import operator
 import os
 import re
 import shutil
+import string
 import subprocess
 import threading
 import time
+import types
 import uuid
-from io import BytesIO
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import Flask, Response, jsonify, render_template, request, send_file
+
+# orjson parses/serializes several times faster than the stdlib; fall back to
+# json when it isn't installed. Both helpers take and return bytes.
+try:
+    import orjson
+
+    def _loads(data):
+        # json.loads(bytes) accepts a UTF-8 BOM; orjson rejects it
+        return orjson.loads(data.removeprefix(codecs.BOM_UTF8))
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+
 
 app = Flask(__name__)
 app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024  # 100MB
@@ -24,7 +48,13 @@ BUNDLED_PROFILES_DIR = Path(os.environ.get(
     "BUNDLED_PROFILES_DIR",
     "/opt/orcaslicer/resources/profiles",
 ))
+SYSTEM_PROFILE_INDEX_CACHE = os.environ.get(
+    "SYSTEM_PROFILE_INDEX_CACHE",
+    str(TEMP_DIR / "system_profile_index.json"),
+)
 SLICE_TIMEOUT = 300  # seconds
+SLICE_RESULT_TTL = 600  # seconds a finished job's G-code is kept for download
+MODEL_COPY_BUFFER_SIZE = 4 * 1024 * 1024  # copy uploaded models in 4MB chunks
 
 VALID_CATEGORIES = {"printer", "process", "filament"}
 
@@ -44,13 +74,58 @@ CATEGORY_TO_SUBDIR = {
 
 VALID_FROM_VALUES = {"system", "User", "user"}
 
-slice_lock = threading.Lock()
-current_job = {"busy": False, "model": None, "started": None}
+VALID_BED_TYPES = {"Cool Plate", "Engineering Plate", "High Temp Plate", "Textured PEI Plate"}
+TRUTHY_VALUES = {"1", "true", "on", "yes"}
 
-# Index of bundled system profiles: {subdir: {name: filepath}}
+# Behind a proxy that honours X-Sendfile, let it serve profile downloads
+# straight from disk instead of streaming them through Python.
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "").strip().lower() in TRUTHY_VALUES
+
+slice_lock = threading.Lock()
+# (busy, model, started). Only replaced whole while holding slice_lock, so
+# readers can unpack it without locking and never see a half-updated job.
+IDLE_JOB_STATE = (False, None, None)
+_job_state = IDLE_JOB_STATE
+
+# Slicing runs off the request thread. One worker keeps the CLI to a single
+# job at a time, matching slice_lock.
+_slice_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+# Submitted jobs: {job_id: {"future", "model", "started", "job_dir"}}
+_slice_jobs = {}
+
+# Index of bundled system profiles: {subdir: {name: filepath str}}
 # Built once at startup, used for resolving "inherits" in user profiles.
 _system_profile_index = {"machine": {}, "process": {}, "filament": {}}
 
+# Cached list_profiles bodies: {category: (dir mtime_ns, generation, json str)}
+# Writers bump the category's generation; a listing scanned under an older
+# generation is never stored or served.
+_list_cache = {}
+_list_generation = {}
+_list_cache_lock = threading.Lock()
+
+# Matches the top-level "name" field near the start of a bundled profile, so
+# indexing doesn't have to decode whole files. Escaped names fall back to a
+# full parse.
+_PROFILE_NAME_RE = re.compile(rb'"name"\s*:\s*"([^"\\]{1,200})"')
+_PROFILE_HEAD_BYTES = 4096
+# Bump when indexing changes (e.g. _read_profile_name or _PROFILE_NAME_RE) so
+# a persisted index built the old way is not reused.
+SYSTEM_PROFILE_INDEX_FORMAT = 1
+
+
+def _read_profile_name(json_file):
+    """Read the "name" field of one bundled profile, or None if unreadable."""
+    try:
+        with open(json_file, "rb") as f:
+            m = _PROFILE_NAME_RE.search(f.read(_PROFILE_HEAD_BYTES))
+            if m:
+                return m.group(1).decode("utf-8")
+            f.seek(0)
+            return _loads(f.read()).get("name")
+    except Exception:
+        return None
+
 
 def build_system_profile_index():
     """Scan bundled OrcaSlicer profiles and index them by name."""
@@ -58,59 +133,123 @@ def build_system_profile_index():
         log.warning("Bundled profiles dir not found: %s", BUNDLED_PROFILES_DIR)
         return
 
-    count = 0
-    for vendor_dir in BUNDLED_PROFILES_DIR.iterdir():
-        if not vendor_dir.is_dir():
-            continue
-        for subdir in ("machine", "process", "filament"):
-            cat_dir = vendor_dir / subdir
-            if not cat_dir.is_dir():
+    # scandir/walk reuse the d_type from the directory listing instead of
+    # stat()ing every entry, and paths stay plain strings.
+    tasks = []
+    max_mtime = os.stat(BUNDLED_PROFILES_DIR).st_mtime_ns
+    with os.scandir(BUNDLED_PROFILES_DIR) as it:
+        for vendor in it:
+            if not vendor.is_dir(follow_symlinks=False):
                 continue
-            for json_file in cat_dir.rglob("*.json"):
-                try:
-                    with open(json_file) as f:
-                        obj = json.load(f)
-                    name = obj.get("name")
-                    if name and name not in _system_profile_index[subdir]:
-                        _system_profile_index[subdir][name] = json_file
-                        count += 1
-                except Exception:
-                    pass
-
-    log.info("Indexed %d bundled system profiles", count)
-
+            for subdir in ("machine", "process", "filament"):
+                cat_dir = os.path.join(vendor.path, subdir)
+                for root, _dirs, files in os.walk(cat_dir, followlinks=False):
+                    # Adding, removing or replacing a file bumps its dir's mtime
+                    max_mtime = max(max_mtime, os.stat(root).st_mtime_ns)
+                    for fn in files:
+                        if fn.endswith(".json"):
+                            tasks.append((subdir, os.path.join(root, fn)))
+
+    # Reuse the index from a previous start if the bundled tree looks the same
+    fingerprint = (
+        SYSTEM_PROFILE_INDEX_FORMAT, str(BUNDLED_PROFILES_DIR), max_mtime, len(tasks),
+    )
+    index = _load_system_profile_index_cache(fingerprint)
+    if index is None:
+        # The first file seen for a name wins
+        index = {"machine": {}, "process": {}, "filament": {}}
+        for subdir, json_file in tasks:
+            name = _read_profile_name(json_file)
+            if name:
+                index[subdir].setdefault(name, json_file)
+        _save_system_profile_index_cache(fingerprint, index)
 
-def resolve_system_profile(subdir, name, _seen=None):
-    """Load a bundled system profile by name, recursively resolving inherits."""
-    if _seen is None:
-        _seen = set()
-    if name in _seen:
-        return {}
-    _seen.add(name)
+    count = 0
+    for subdir, names in index.items():
+        for name, json_file in names.items():
+            if name not in _system_profile_index[subdir]:
+                _system_profile_index[subdir][name] = json_file
+                count += 1
 
-    path = _system_profile_index.get(subdir, {}).get(name)
-    if not path:
-        return {}
+    resolve_system_profile.cache_clear()
+    log.info("Indexed %d bundled system profiles", count)
 
-    with open(path) as f:
-        obj = json.load(f)
 
-    parent_name = obj.get("inherits")
-    if parent_name:
-        parent = resolve_system_profile(subdir, parent_name, _seen)
-        parent.update(obj)
-        return parent
+def _load_system_profile_index_cache(fingerprint):
+    try:
+        with open(SYSTEM_PROFILE_INDEX_CACHE, "rb") as f:
+            cached = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.warning("Ignoring unreadable profile index cache: %s", SYSTEM_PROFILE_INDEX_CACHE)
+        return None
+
+    if not isinstance(cached, dict) or cached.get("fingerprint") != list(fingerprint):
+        return None
+    # TEMP_DIR is shared scratch space; only accept paths inside the bundle
+    prefix = os.path.join(str(BUNDLED_PROFILES_DIR), "")
+    index = cached.get("index")
+    try:
+        if set(index) != {"machine", "process", "filament"} or not all(
+            isinstance(name, str) and path.startswith(prefix)
+            for names in index.values() for name, path in names.items()
+        ):
+            raise ValueError
+    except (TypeError, AttributeError, ValueError):
+        log.warning("Ignoring malformed profile index cache: %s", SYSTEM_PROFILE_INDEX_CACHE)
+        return None
+    log.info("Loaded bundled profile index from %s", SYSTEM_PROFILE_INDEX_CACHE)
+    return index
+
+
+def _save_system_profile_index_cache(fingerprint, index):
+    # Write to a temp file and rename so a crash never leaves a partial cache
+    tmp_path = f"{SYSTEM_PROFILE_INDEX_CACHE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SYSTEM_PROFILE_INDEX_CACHE), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps({"fingerprint": list(fingerprint), "index": index}))
+        os.replace(tmp_path, SYSTEM_PROFILE_INDEX_CACHE)
+    except OSError as e:
+        log.warning("Could not write profile index cache: %s", e)
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_system_profile(subdir, name):
+    """Load a bundled system profile by name, recursively resolving inherits.
+
+    Returns a cached read-only mapping; build a new dict to change it.
+    """
+    # Walk up the inherits chain, then merge from the root down so children
+    # override their parents. Stops at a missing parent or a cycle.
+    chain = []
+    seen = set()
+    while name and name not in seen:
+        seen.add(name)
+        path = _system_profile_index.get(subdir, {}).get(name)
+        if not path:
+            break
+        try:
+            with open(path, "rb") as f:
+                obj = _loads(f.read())
+        except OSError:
+            log.warning("Could not read bundled profile %s", path)
+            break
+        chain.append(obj)
+        name = obj.get("inherits")
 
-    return obj
+    merged = {}
+    for obj in reversed(chain):
+        merged.update(obj)
+    return types.MappingProxyType(merged)
 
 
 # --- Helpers ---
 
 
-def ensure_orca_metadata(data_bytes, category):
+def ensure_orca_metadata(obj, category):
     """Ensure OrcaSlicer CLI compatibility: set type/from, resolve inherits."""
-    obj = json.loads(data_bytes)
-
     orca_type = CATEGORY_TO_ORCA_TYPE[category]
     obj["type"] = orca_type
 
@@ -124,18 +263,29 @@ def ensure_orca_metadata(data_bytes, category):
     inherits_name = obj.get("inherits")
     if inherits_name:
         subdir = CATEGORY_TO_SUBDIR[category]
+        # Merge straight from the cached read-only base; one dict is built
+        # and the upload's own "inherits" wins over the parent's. The merge is
+        # shallow: list values such as nozzle_diameter are still shared with
+        # the cache and must never be mutated in place.
         base = resolve_system_profile(subdir, inherits_name)
         if base:
-            base.update(obj)
-            obj = base
-            obj["inherits"] = inherits_name
+            obj = {**base, **obj}
             log.info("Resolved inherits '%s' for %s profile (%d keys)",
                      inherits_name, category, len(obj))
         else:
             log.warning("Could not resolve inherits '%s' for %s profile",
                         inherits_name, category)
 
-    return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+    return obj
+
+
+def profile_data_for_upload(raw, obj, category):
+    """Return the bytes to store, rewriting only profiles that aren't CLI-ready."""
+    if (obj.get("type") == CATEGORY_TO_ORCA_TYPE[category]
+            and obj.get("from") in VALID_FROM_VALUES
+            and not obj.get("inherits")):
+        return raw
+    return _dumps(ensure_orca_metadata(obj, category))
 
 
 def build_gcode_filename(format_template, model_filename, process_data, filament_data):
@@ -187,13 +337,25 @@ def build_gcode_filename(format_template, model_filename, process_data, filament
     return result or f"{model_stem}.gcode"
 
 
+class _SanitizeTable(dict):
+    """str.translate table that lowercases into [a-z0-9-]; anything else maps to '-'."""
+
+    def __missing__(self, codepoint):
+        return "-"
+
+
+# Lowercasing is folded into the table so names are scanned once. Besides
+# A-Z, only these two code points lowercase to anything containing ASCII.
+_SANITIZE_TABLE = _SanitizeTable(
+    (ord(c), c.lower()) for c in string.ascii_letters + string.digits + "-"
+)
+_SANITIZE_TABLE[0x130] = "i-"  # LATIN CAPITAL LETTER I WITH DOT ABOVE -> "i\u0307"
+_SANITIZE_TABLE[0x212A] = "k"  # KELVIN SIGN
+_DASHES_RE = re.compile(r"-+")
+
+
 def sanitize_profile_name(name):
-    name = name.lower()
-    name = re.sub(r"[^a-z0-9-]", "-", name)
-    name = re.sub(r"-+", "-", name)
-    name = name.strip("-")
-    name = name[:100]
-    return name
+    return _DASHES_RE.sub("-", name.translate(_SANITIZE_TABLE)).strip("-")[:100]
 
 
 def validate_category(category):
@@ -206,15 +368,32 @@ def get_profile_path(category, name):
     return PROFILES_DIR / category / f"{name}.json"
 
 
-def profile_info(category, name):
-    path = get_profile_path(category, name)
-    stat = path.stat()
-    return {
-        "name": name,
-        "category": category,
-        "size": stat.st_size,
-        "modified": stat.st_mtime,
-    }
+def invalidate_profile_list(category):
+    # Directory mtime misses in-place rewrites and changes within one
+    # timestamp tick, so writers invalidate the cached listing explicitly.
+    with _list_cache_lock:
+        _list_generation[category] = _list_generation.get(category, 0) + 1
+        _list_cache.pop(category, None)
+
+
+def write_profile(path, data):
+    """Write profile bytes and return the stat of the written file."""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        return os.fstat(f.fileno())
+
+
+def profile_info_response(category, name, stat=None):
+    """JSON response describing one profile, built without the JSON provider."""
+    if stat is None:
+        stat = os.stat(get_profile_path(category, name))
+    # category is validated against VALID_CATEGORIES, so only name needs escaping
+    body = (
+        f'{{"category":"{category}","modified":{stat.st_mtime!r},'
+        f'"name":{json.dumps(name)},"size":{stat.st_size}}}'
+    )
+    return Response(body, mimetype="application/json")
 
 
 # --- Error handlers ---
@@ -274,17 +453,35 @@ def list_profiles(category):
     profile_dir = PROFILES_DIR / category
     profile_dir.mkdir(parents=True, exist_ok=True)
 
+    # The UI polls this endpoint; reuse the serialized listing until the
+    # directory changes.
+    generation = _list_generation.get(category, 0)
+    dir_mtime = os.stat(profile_dir).st_mtime_ns
+    cached = _list_cache.get(category)
+    if cached and cached[:2] == (dir_mtime, generation):
+        return Response(cached[2], mimetype="application/json")
+
     profiles = []
-    for f in sorted(profile_dir.glob("*.json")):
-        name = f.stem
-        stat = f.stat()
+    with os.scandir(profile_dir) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+        ]
+    entries.sort(key=operator.attrgetter("name"))
+    for entry in entries:
+        stat = entry.stat()
         profiles.append({
-            "name": name,
+            "name": entry.name[:-len(".json")],
             "size": stat.st_size,
             "modified": stat.st_mtime,
         })
 
-    return jsonify(category=category, profiles=profiles)
+    body = app.json.dumps({"category": category, "profiles": profiles})
+    with _list_cache_lock:
+        # A write during the scan may not be reflected in body; don't keep it
+        if _list_generation.get(category, 0) == generation:
+            _list_cache[category] = (dir_mtime, generation, body)
+    return Response(body, mimetype="application/json")
 
 
 @app.route("/api/profiles/<category>", methods=["POST"])
@@ -300,14 +497,14 @@ def upload_profile(category):
     if not file.filename:
         return jsonify(error="Empty filename"), 400
 
-    # Read and validate JSON
+    # Parse once to validate; CLI-ready uploads are stored byte-for-byte
+    raw = file.stream.read()
     try:
-        data = file.read()
-        json.loads(data)
+        obj = _loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return jsonify(error="File is not valid JSON"), 400
 
-    data = ensure_orca_metadata(data, category)
+    data = profile_data_for_upload(raw, obj, category)
 
     # Determine name
     name = request.form.get("name", "").strip()
@@ -325,8 +522,9 @@ def upload_profile(category):
     if path.exists():
         return jsonify(error=f"Profile '{name}' already exists in {category}. Use PUT to replace."), 409
 
-    path.write_bytes(data)
-    return jsonify(**profile_info(category, name)), 201
+    stat = write_profile(path, data)
+    invalidate_profile_list(category)
+    return profile_info_response(category, name, stat), 201
 
 
 @app.route("/api/profiles/<category>/<name>")
@@ -353,20 +551,21 @@ def replace_profile(category, name):
 
     file = request.files["file"]
 
+    raw = file.stream.read()
     try:
-        data = file.read()
-        json.loads(data)
+        obj = _loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return jsonify(error="File is not valid JSON"), 400
 
-    data = ensure_orca_metadata(data, category)
+    data = profile_data_for_upload(raw, obj, category)
 
     profile_dir = PROFILES_DIR / category
     profile_dir.mkdir(parents=True, exist_ok=True)
 
     path = get_profile_path(category, name)
-    path.write_bytes(data)
-    return jsonify(**profile_info(category, name))
+    stat = write_profile(path, data)
+    invalidate_profile_list(category)
+    return profile_info_response(category, name, stat)
 
 
 @app.route("/api/profiles/<category>/<name>", methods=["PATCH"])
@@ -388,14 +587,15 @@ def rename_profile(category, name):
         return jsonify(error="Invalid new name"), 400
 
     if new_name == name:
-        return jsonify(**profile_info(category, name))
+        return profile_info_response(category, name)
 
     new_path = get_profile_path(category, new_name)
     if new_path.exists():
         return jsonify(error=f"Profile '{new_name}' already exists in {category}"), 409
 
     path.rename(new_path)
-    return jsonify(**profile_info(category, new_name))
+    invalidate_profile_list(category)
+    return profile_info_response(category, new_name)
 
 
 @app.route("/api/profiles/<category>/<name>", methods=["DELETE"])
@@ -409,6 +609,7 @@ def delete_profile(category, name):
         return jsonify(error=f"Profile '{name}' not found in {category}"), 404
 
     path.unlink()
+    invalidate_profile_list(category)
     return jsonify(deleted=name, category=category)
 
 
@@ -417,17 +618,30 @@ def delete_profile(category, name):
 
 @app.route("/api/slice/status")
 def slice_status():
-    if current_job["busy"]:
-        return jsonify(
-            busy=True,
-            model=current_job["model"],
-            started=current_job["started"],
-        )
+    busy, model, started = _job_state
+    if busy:
+        return jsonify(busy=True, model=model, started=started)
     return jsonify(busy=False)
 
 
+@app.route("/api/slice/status/<job_id>")
+def slice_job_status(job_id):
+    job = _slice_jobs.get(job_id)
+    if not job:
+        return jsonify(error=f"Slice job '{job_id}' not found"), 404
+
+    return jsonify(
+        job_id=job_id,
+        model=job["model"],
+        started=job["started"],
+        done=job["future"].done(),
+    )
+
+
 @app.route("/api/slice", methods=["POST"])
 def slice_model():
+    global _job_state
+
     # Validate model file
     if "model" not in request.files:
         return jsonify(error="No model file provided. Use multipart field 'model'."), 400
@@ -463,18 +677,18 @@ def slice_model():
     if missing:
         return jsonify(error=f"Profiles not found: {', '.join(missing)}"), 404
 
-    # Acquire lock
+    # Acquire lock; the worker releases it once the slicer exits
     if not slice_lock.acquire(blocking=False):
         return jsonify(error="Slicer is busy. Try again later.", busy=True), 409
 
+    prune_slice_jobs()
+
     job_id = str(uuid.uuid4())
     job_dir = TEMP_DIR / job_id
     start_time = time.time()
 
     try:
-        current_job["busy"] = True
-        current_job["model"] = model_filename
-        current_job["started"] = start_time
+        _job_state = (True, model_filename, start_time)
 
         # Set up temp directory
         job_dir.mkdir(parents=True, exist_ok=True)
@@ -482,14 +696,13 @@ def slice_model():
         output_dir.mkdir()
 
         model_path = job_dir / model_filename
-        model_file.save(str(model_path))
+        model_file.save(str(model_path), buffer_size=MODEL_COPY_BUFFER_SIZE)
 
         # Build command
-        orient = request.form.get("orient", "").strip().lower() in ("1", "true", "on", "yes")
+        orient = request.form.get("orient", "").strip().lower() in TRUTHY_VALUES
         bed_type = request.form.get("bed_type", "").strip()
-        VALID_BED_TYPES = {"Cool Plate", "Engineering Plate", "High Temp Plate", "Textured PEI Plate"}
 
-        cmd = [
+        cmd = (
             ORCASLICER_BIN,
             "--slice", "0",
             "--load-settings", f"{printer_path};{process_path}",
@@ -497,65 +710,131 @@ def slice_model():
             "--allow-newer-file",
             "--arrange", "1",
             "--ensure-on-bed",
-        ]
-        if orient:
-            cmd.extend(["--orient", "1"])
-        if bed_type in VALID_BED_TYPES:
-            cmd.extend(["--curr-bed-type", bed_type])
-        cmd.extend(["--outputdir", str(output_dir), str(model_path)])
+            *(("--orient", "1") if orient else ()),
+            *(("--curr-bed-type", bed_type) if bed_type in VALID_BED_TYPES else ()),
+            "--outputdir", str(output_dir),
+            str(model_path),
+        )
+
+        future = _slice_executor.submit(
+            run_slice, cmd, output_dir, model_filename,
+            process_path, filament_path, start_time,
+        )
+    except Exception as e:
+        _job_state = IDLE_JOB_STATE
+        if job_dir.exists():
+            shutil.rmtree(job_dir, ignore_errors=True)
+        slice_lock.release()
+        return jsonify(error=f"Slicing error: {str(e)}"), 500
 
+    _slice_jobs[job_id] = {
+        "future": future,
+        "model": model_filename,
+        "started": start_time,
+        "job_dir": job_dir,
+    }
+    base = request.url_root.rstrip("/")
+    return jsonify(
+        job_id=job_id,
+        status_url=f"{base}/api/slice/status/{job_id}",
+        result_url=f"{base}/api/slice/result/{job_id}",
+    ), 202
+
+
+def run_slice(cmd, output_dir, model_filename, process_path, filament_path, start_time):
+    """Run the slicer for one job on the worker thread and describe the output."""
+    global _job_state
+
+    try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=SLICE_TIMEOUT,
         )
+    finally:
+        _job_state = IDLE_JOB_STATE
+        slice_lock.release()
 
-        # Find output gcode
-        gcode_files = list(output_dir.glob("*.gcode"))
-        if not gcode_files:
-            stdout_excerpt = (result.stdout or "")[:2000]
-            stderr_excerpt = (result.stderr or "")[:2000]
-            return jsonify(
-                error="Slicing failed: no GCODE output produced",
-                exit_code=result.returncode,
-                stdout=stdout_excerpt,
-                stderr=stderr_excerpt,
-            ), 500
-
-        gcode_path = gcode_files[0]
-        gcode_data = BytesIO(gcode_path.read_bytes())
-
-        # Build gcode filename from process profile's filename_format template
-        model_stem = Path(model_filename).stem
-        try:
-            with open(process_path) as f:
-                process_data = json.load(f)
-        except Exception:
-            process_data = {}
-        try:
-            with open(filament_path) as f:
-                filament_data = json.load(f)
-        except Exception:
-            filament_data = {}
-
-        filename_format = process_data.get("filename_format", "")
-        if filename_format:
-            gcode_name = build_gcode_filename(
-                filename_format, model_filename, process_data, filament_data,
-            )
-        else:
-            gcode_name = f"{model_stem}.gcode"
-        elapsed = round(time.time() - start_time, 2)
+    # Find output gcode
+    gcode_files = list(output_dir.glob("*.gcode"))
+    if not gcode_files:
+        return {
+            "error": "Slicing failed: no GCODE output produced",
+            "exit_code": result.returncode,
+            "stdout": (result.stdout or "")[:2000],
+            "stderr": (result.stderr or "")[:2000],
+        }
+
+    # Build gcode filename from process profile's filename_format template
+    model_stem = Path(model_filename).stem
+    try:
+        with open(process_path, "rb") as f:
+            process_data = _loads(f.read())
+    except Exception:
+        process_data = {}
+    try:
+        with open(filament_path, "rb") as f:
+            filament_data = _loads(f.read())
+    except Exception:
+        filament_data = {}
+
+    filename_format = process_data.get("filename_format", "")
+    if filename_format:
+        gcode_name = build_gcode_filename(
+            filename_format, model_filename, process_data, filament_data,
+        )
+    else:
+        gcode_name = f"{model_stem}.gcode"
+
+    return {
+        "gcode_path": gcode_files[0],
+        "gcode_name": gcode_name,
+        "elapsed": round(time.time() - start_time, 2),
+        "stdout": result.stdout or "",
+    }
+
+
+def prune_slice_jobs():
+    """Drop finished jobs whose results were never fetched."""
+    cutoff = time.time() - SLICE_TIMEOUT - SLICE_RESULT_TTL
+    for job_id, job in list(_slice_jobs.items()):
+        if job["future"].done() and job["started"] < cutoff:
+            _slice_jobs.pop(job_id, None)
+            shutil.rmtree(job["job_dir"], ignore_errors=True)
+
+
+@app.route("/api/slice/result/<job_id>")
+def slice_result(job_id):
+    job = _slice_jobs.get(job_id)
+    if not job:
+        return jsonify(error=f"Slice job '{job_id}' not found"), 404
 
+    if not job["future"].done():
+        return jsonify(job_id=job_id, done=False), 202
+
+    # Results are handed out once; whoever pops the job owns its cleanup
+    if _slice_jobs.pop(job_id, None) is None:
+        return jsonify(error=f"Slice job '{job_id}' not found"), 404
+
+    try:
+        result = job["future"].result()
+        if "error" in result:
+            return jsonify(**result), 500
+
+        # Stream from an open handle rather than reading into memory. The
+        # handle keeps the data readable after job_dir is removed below.
+        gcode_file = open(result["gcode_path"], "rb")
         response = send_file(
-            gcode_data,
+            gcode_file,
             mimetype="application/octet-stream",
-            download_name=gcode_name,
+            download_name=result["gcode_name"],
             as_attachment=True,
+            conditional=False,
         )
-        response.headers["X-Slice-Time-Seconds"] = str(elapsed)
-        stdout_header = (result.stdout or "")[:500].replace("\n", " ")
+        response.content_length = os.fstat(gcode_file.fileno()).st_size
+        response.headers["X-Slice-Time-Seconds"] = str(result["elapsed"])
+        stdout_header = result["stdout"][:500].replace("\n", " ")
         response.headers["X-Slicer-Stdout"] = stdout_header
         return response
 
@@ -564,12 +843,7 @@ def slice_model():
     except Exception as e:
         return jsonify(error=f"Slicing error: {str(e)}"), 500
     finally:
-        current_job["busy"] = False
-        current_job["model"] = None
-        current_job["started"] = None
-        if job_dir.exists():
-            shutil.rmtree(job_dir, ignore_errors=True)
-        slice_lock.release()
+        shutil.rmtree(job["job_dir"], ignore_errors=True)
 
 
 # --- Help ---
@@ -620,12 +894,20 @@ def api_help():
             "command": f"curl {base}/api/slice/status",
         },
         {
-            "title": "Slice a model",
-            "command": f"curl -X POST {base}/api/slice -F 'model=@model.stl' -F 'printer=my-printer' -F 'process=my-process' -F 'filament=my-filament' -o output.gcode",
+            "title": "Slice a model (returns a job_id)",
+            "command": f"curl -X POST {base}/api/slice -F 'model=@model.stl' -F 'printer=my-printer' -F 'process=my-process' -F 'filament=my-filament'",
         },
         {
             "title": "Slice with bed type and auto-orient",
-            "command": f"curl -X POST {base}/api/slice -F 'model=@model.stl' -F 'printer=my-printer' -F 'process=my-process' -F 'filament=my-filament' -F 'bed_type=Textured PEI Plate' -F 'orient=1' -o output.gcode",
+            "command": f"curl -X POST {base}/api/slice -F 'model=@model.stl' -F 'printer=my-printer' -F 'process=my-process' -F 'filament=my-filament' -F 'bed_type=Textured PEI Plate' -F 'orient=1'",
+        },
+        {
+            "title": "Check a slice job",
+            "command": f"curl {base}/api/slice/status/JOB_ID",
+        },
+        {
+            "title": "Download the sliced GCODE (202 until ready)",
+            "command": f"curl -f {base}/api/slice/result/JOB_ID -o output.gcode",
         },
     ])
 